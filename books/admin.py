@@ -1,8 +1,18 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import Book, Author, Publisher
+from .models import Book, BookContent, Author, Publisher
+
+
+class BookContentInline(admin.StackedInline):
+    model = BookContent
+
+
+@admin.register(Book)
+class BookAdmin(admin.ModelAdmin):
+    ordering = ['-created_at']
+    inlines = [BookContentInline]
+
 
-admin.site.register(Book)
 admin.site.register(Author)
-admin.site.register(Publisher)
\ No newline at end of file
+admin.site.register(Publisher)
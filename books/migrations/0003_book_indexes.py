@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0002_alter_author_options_alter_book_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(fields=["-created_at"], name="books_book_created_ea3fe5_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(fields=["author", "publisher"], name="books_book_author__ee0d9e_idx"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0003_book_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="book",
+            unique_together=set(),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:17
+
+import books.models
+from django.db import migrations, models
+
+
+def fill_isbn_num(apps, schema_editor):
+    Book = apps.get_model("books", "Book")
+    books = list(Book.objects.only("id", "isbn"))
+    isbns = {}
+    for book in books:
+        digits = "".join(char for char in book.isbn or "" if char.isdigit())
+        book.isbn_num = int(digits) if digits else None
+        if book.isbn_num is not None:
+            isbns.setdefault(book.isbn_num, []).append(book.isbn)
+    duplicates = [values for values in isbns.values() if len(values) > 1]
+    if duplicates:
+        raise ValueError(
+            "Cannot fill the unique Book.isbn_num column, these ISBNs have the same digits: %s. "
+            "Fix or remove the duplicate books, then run the migration again."
+            % "; ".join(", ".join(values) for values in duplicates[:10])
+        )
+    Book.objects.bulk_update(books, ["isbn_num"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0004_remove_book_unique_together"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="book",
+            name="isbn_num",
+            field=books.models.ISBNNumberField(editable=False, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_isbn_num, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="book",
+            name="isbn",
+            field=models.CharField(db_index=True, max_length=13),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:17
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def fill_price_cents(apps, schema_editor):
+    Book = apps.get_model("books", "Book")
+    books = list(Book.objects.only("id", "price"))
+    for book in books:
+        book.price_cents = int(book.price * 100)
+    Book.objects.bulk_update(books, ["price_cents"], batch_size=1000)
+
+
+def fill_price(apps, schema_editor):
+    Book = apps.get_model("books", "Book")
+    books = list(Book.objects.only("id", "price_cents"))
+    for book in books:
+        book.price = Decimal(book.price_cents) / 100
+    Book.objects.bulk_update(books, ["price"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0005_book_isbn_num"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="book",
+            name="price_cents",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_price_cents, fill_price),
+        migrations.RemoveField(
+            model_name="book",
+            name="price",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0006_book_price_cents"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="book",
+            options={"verbose_name": "Book", "verbose_name_plural": "Books"},
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0007_remove_book_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="author",
+            name="email",
+            field=models.CharField(blank=True, max_length=254, null=True),
+        ),
+        migrations.AlterField(
+            model_name="author",
+            name="website",
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AlterField(
+            model_name="book",
+            name="cover_image",
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AlterField(
+            model_name="publisher",
+            name="contact_email",
+            field=models.CharField(blank=True, max_length=254, null=True),
+        ),
+        migrations.AlterField(
+            model_name="publisher",
+            name="logo",
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AlterField(
+            model_name="publisher",
+            name="website",
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+    ]
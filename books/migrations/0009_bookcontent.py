@@ -0,0 +1,72 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def move_content_to_bookcontent(apps, schema_editor):
+    Book = apps.get_model("books", "Book")
+    BookContent = apps.get_model("books", "BookContent")
+    BookContent.objects.bulk_create(
+        (
+            BookContent(book_id=book_id, description=description, summary=summary)
+            for book_id, description, summary in Book.objects.values_list("id", "description", "summary").iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+def move_content_to_book(apps, schema_editor):
+    Book = apps.get_model("books", "Book")
+    BookContent = apps.get_model("books", "BookContent")
+    books = []
+    for book_id, description, summary in BookContent.objects.values_list("book_id", "description", "summary"):
+        books.append(Book(id=book_id, description=description, summary=summary))
+    Book.objects.bulk_update(books, ["description", "summary"], batch_size=1000)
+    Book.objects.filter(description__isnull=True).update(description="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0008_charfield_urls_and_emails"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookContent",
+            fields=[
+                (
+                    "book",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="content",
+                        serialize=False,
+                        to="books.book",
+                    ),
+                ),
+                ("description", models.TextField()),
+                ("summary", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Book content",
+                "verbose_name_plural": "Book contents",
+            },
+        ),
+        # Nullable while the column is dropped, so the migration can be reversed
+        migrations.AlterField(
+            model_name="book",
+            name="description",
+            field=models.TextField(null=True),
+        ),
+        migrations.RunPython(move_content_to_bookcontent, move_content_to_book),
+        migrations.RemoveField(
+            model_name="book",
+            name="description",
+        ),
+        migrations.RemoveField(
+            model_name="book",
+            name="summary",
+        ),
+    ]
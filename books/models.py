@@ -1,43 +1,132 @@
+from decimal import Decimal
+
 from django.db import models
 
 # Create your models here.
 
+def isbn_to_number(isbn):
+    """Returns the digits of an ISBN as an integer, or None when it has no digits."""
+    digits = ''.join(char for char in isbn or '' if char.isdigit())
+    return int(digits) if digits else None
+
+
+class ISBNNumberField(models.BigIntegerField):
+    """
+    Stores the digits of the book's ISBN as an integer, refreshed on every save.
+
+    Book.save(update_fields=...), BookQuerySet.update() and BookQuerySet.bulk_update()
+    add it whenever isbn is written, since update_fields and the queryset methods skip
+    fields that aren't listed. Updates with expressions or raw SQL must set it themselves.
+    """
+
+    def pre_save(self, model_instance, add):
+        value = isbn_to_number(model_instance.isbn)
+        setattr(model_instance, self.attname, value)
+        return value
+
+
+class BookQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        isbn = kwargs.get('isbn')
+        if 'isbn' in kwargs and 'isbn_num' not in kwargs and not hasattr(isbn, 'resolve_expression'):
+            kwargs['isbn_num'] = isbn_to_number(isbn)
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        if 'isbn' in fields:
+            objs = list(objs)
+            for book in objs:
+                book.isbn_num = isbn_to_number(book.isbn)
+            fields = [*fields, 'isbn_num'] if 'isbn_num' not in fields else fields
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
+    def with_related(self):
+        return self.select_related('author', 'publisher')
+
+    def with_content(self):
+        return self.select_related('content')
+
+
 class Book(models.Model):
     title = models.CharField(max_length=100)
-    description = models.TextField()
     author = models.ForeignKey('Author', on_delete=models.CASCADE, related_name='books')
     publisher = models.ForeignKey('Publisher', on_delete=models.CASCADE, related_name='books')
     publication_date = models.DateField()
-    isbn = models.CharField(max_length=13, unique=True)
+    isbn = models.CharField(max_length=13, db_index=True)
+    isbn_num = ISBNNumberField(unique=True, null=True, editable=False)
     pages = models.PositiveIntegerField()
-    cover_image = models.URLField(blank=True, null=True)
+    cover_image = models.CharField(max_length=200, blank=True, null=True)
     language = models.CharField(max_length=30, default='English')
     genre = models.CharField(max_length=50, blank=True, null=True)
-    summary = models.TextField(blank=True, null=True)
-    price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    price_cents = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookQuerySet.as_manager()
+
     class Meta:
-        ordering = ['-created_at']
         verbose_name = 'Book'
         verbose_name_plural = 'Books'
-        unique_together = ['title', 'isbn', 'publisher', 'author']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['author', 'publisher']),
+        ]
 
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'isbn' in update_fields and 'isbn_num' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'isbn_num']
+        super().save(*args, **kwargs)
+
+    @property
+    def price(self):
+        return Decimal(self.price_cents) / 100
+
+    @price.setter
+    def price(self, value):
+        self.price_cents = int(Decimal(str(value)) * 100)
+
+
+class BookContent(models.Model):
+    book = models.OneToOneField(Book, on_delete=models.CASCADE, primary_key=True, related_name='content')
+    description = models.TextField()
+    summary = models.TextField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Book content'
+        verbose_name_plural = 'Book contents'
+
+
+    def __str__(self):
+        return str(self.book)
+
+
+class BookRelatedQuerySet(models.QuerySet):
+    def with_books(self):
+        book_field = self.model._meta.get_field('books').field.name
+        return self.prefetch_related(
+            models.Prefetch('books', queryset=Book.objects.only('id', 'title', book_field))
+        )
+
+    def with_book_count(self):
+        return self.annotate(book_count=models.Count('books'))
     
 
 class Author(models.Model):
     name = models.CharField(max_length=100, unique=True)
     bio = models.TextField(blank=True, null=True)
-    email = models.EmailField(blank=True, null=True)
-    website = models.URLField(blank=True, null=True)
+    email = models.CharField(max_length=254, blank=True, null=True)
+    website = models.CharField(max_length=200, blank=True, null=True)
     birth_date = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookRelatedQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Author'
         verbose_name_plural = 'Authors'
@@ -50,17 +139,19 @@ class Author(models.Model):
 class Publisher(models.Model):
     name = models.CharField(max_length=100, unique=True)
     address = models.TextField(blank=True, null=True)
-    website = models.URLField(blank=True, null=True)
+    website = models.CharField(max_length=200, blank=True, null=True)
     established_date = models.DateField(blank=True, null=True)
-    contact_email = models.EmailField(blank=True, null=True)
+    contact_email = models.CharField(max_length=254, blank=True, null=True)
     phone_number = models.CharField(max_length=20, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
-    logo = models.URLField(blank=True, null=True)
+    logo = models.CharField(max_length=200, blank=True, null=True)
     social_media_links = models.JSONField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookRelatedQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Publisher'
         verbose_name_plural = 'Publishers'
@@ -1,7 +1,20 @@
 from django.test import TestCase
 from django.core.management import call_command
+from decimal import Decimal
 from io import StringIO
-from books.models import Book, Author, Publisher
+from django.db import connection
+from books.models import Book, BookContent, Author, Publisher
+
+
+def _truncate(*models):
+    """Empty the given models' tables, with a single TRUNCATE on PostgreSQL"""
+    if connection.vendor == "postgresql":
+        tables = ", ".join(connection.ops.quote_name(model._meta.db_table) for model in models)
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE")
+    else:
+        for model in models:
+            model.objects.all().delete()
 
 
 class BooksExampleAppTestCase(TestCase):
@@ -9,9 +22,7 @@ class BooksExampleAppTestCase(TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        Book.objects.all().delete()
-        Author.objects.all().delete()
-        Publisher.objects.all().delete()
+        _truncate(BookContent, Book, Author, Publisher)
 
         # Reset the global object counter
         from model_populator import engine
@@ -25,6 +36,7 @@ class BooksExampleAppTestCase(TestCase):
         self.assertIsNotNone(apps.get_model("books", "Book"))
         self.assertIsNotNone(apps.get_model("books", "Author"))
         self.assertIsNotNone(apps.get_model("books", "Publisher"))
+        self.assertIsNotNone(apps.get_model("books", "BookContent"))
 
     def test_author_creation(self):
         """Test manual author creation"""
@@ -45,7 +57,6 @@ class BooksExampleAppTestCase(TestCase):
 
         book = Book.objects.create(
             title="1984",
-            description="Dystopian novel",
             author=author,
             publisher=publisher,
             publication_date="1949-06-08",
@@ -58,6 +69,102 @@ class BooksExampleAppTestCase(TestCase):
         self.assertEqual(book.publisher, publisher)
         self.assertEqual(author.books.count(), 1)
 
+    def test_book_with_related_single_query(self):
+        """Test that with_related loads author and publisher in the same query"""
+        author = Author.objects.create(name="George Orwell")
+        publisher = Publisher.objects.create(name="Secker and Warburg")
+        for isbn in ["9780451524935", "9780451526342"]:
+            Book.objects.create(
+                title=f"Book {isbn}",
+                author=author,
+                publisher=publisher,
+                publication_date="1949-06-08",
+                isbn=isbn,
+                pages=328,
+            )
+
+        with self.assertNumQueries(1):
+            names = [(book.author.name, book.publisher.name) for book in Book.objects.with_related()]
+        self.assertEqual(names, [("George Orwell", "Secker and Warburg")] * 2)
+
+    def test_with_book_count_annotation(self):
+        """Test that with_book_count annotates the number of books of each author and publisher"""
+        publisher = Publisher.objects.create(name="Penguin Books")
+        author = Author.objects.create(name="Author 1")
+        Author.objects.create(name="Author 2")
+        for isbn in ["1234567890123", "1234567890124"]:
+            Book.objects.create(
+                title=f"Book {isbn}",
+                author=author,
+                publisher=publisher,
+                publication_date="2024-01-01",
+                isbn=isbn,
+                pages=200,
+            )
+
+        with self.assertNumQueries(1):
+            counts = dict(Author.objects.with_book_count().values_list("name", "book_count"))
+        self.assertEqual(counts, {"Author 1": 2, "Author 2": 0})
+        self.assertEqual(Publisher.objects.with_book_count().get().book_count, 2)
+
+    def test_author_with_books_prefetch(self):
+        """Test that with_books loads the books of all authors in one extra query"""
+        publisher = Publisher.objects.create(name="Penguin Books")
+        for name, isbn in [("Author 1", "1234567890123"), ("Author 2", "1234567890124")]:
+            Book.objects.create(
+                title=f"Book by {name}",
+                author=Author.objects.create(name=name),
+                publisher=publisher,
+                publication_date="2024-01-01",
+                isbn=isbn,
+                pages=200,
+            )
+
+        with self.assertNumQueries(2):
+            titles = {
+                author.name: [book.title for book in author.books.all()] for author in Author.objects.with_books()
+            }
+        self.assertEqual(titles, {"Author 1": ["Book by Author 1"], "Author 2": ["Book by Author 2"]})
+
+    def test_book_price_stored_in_cents(self):
+        """Test that the price property reads and writes price_cents"""
+        author = Author.objects.create(name="Test Author")
+        publisher = Publisher.objects.create(name="Test Publisher")
+
+        book = Book.objects.create(
+            title="Test Book",
+            author=author,
+            publisher=publisher,
+            publication_date="2024-01-01",
+            isbn="1234567890123",
+            pages=200,
+            price=15.99,
+        )
+
+        book.refresh_from_db()
+        self.assertEqual(book.price_cents, 1599)
+        self.assertEqual(book.price, Decimal("15.99"))
+
+    def test_book_content(self):
+        """Test that description and summary live in the one-to-one BookContent table"""
+        book = Book.objects.create(
+            title="1984",
+            author=Author.objects.create(name="George Orwell"),
+            publisher=Publisher.objects.create(name="Secker and Warburg"),
+            publication_date="1949-06-08",
+            isbn="9780451524935",
+            pages=328,
+        )
+        BookContent.objects.create(book=book, description="Dystopian novel")
+
+        with self.assertNumQueries(1):
+            book = Book.objects.with_content().get(pk=book.pk)
+            self.assertEqual(book.content.description, "Dystopian novel")
+            self.assertIsNone(book.content.summary)
+
+        book.delete()
+        self.assertEqual(BookContent.objects.count(), 0)
+
     def test_book_string_representation(self):
         """Test __str__ method of Book model"""
         author = Author.objects.create(name="Test Author")
@@ -65,7 +172,6 @@ class BooksExampleAppTestCase(TestCase):
 
         book = Book.objects.create(
             title="Test Book",
-            description="Test description",
             author=author,
             publisher=publisher,
             publication_date="2024-01-01",
@@ -93,7 +199,6 @@ class BooksExampleAppTestCase(TestCase):
 
         Book.objects.create(
             title="Book 1",
-            description="Description 1",
             author=author,
             publisher=publisher,
             publication_date="2024-01-01",
@@ -106,7 +211,6 @@ class BooksExampleAppTestCase(TestCase):
         with self.assertRaises(Exception):
             Book.objects.create(
                 title="Book 2",
-                description="Description 2",
                 author=author,
                 publisher=publisher,
                 publication_date="2024-01-02",
@@ -115,6 +219,74 @@ class BooksExampleAppTestCase(TestCase):
                 price=12.00,
             )
 
+    def test_isbn_num_from_isbn(self):
+        """Test that isbn_num holds the ISBN digits, including for bulk_create"""
+        author = Author.objects.create(name="Test Author")
+        publisher = Publisher.objects.create(name="Test Publisher")
+
+        Book.objects.bulk_create(
+            [
+                Book(
+                    title="Book 1",
+                    author=author,
+                    publisher=publisher,
+                    publication_date="2024-01-01",
+                    isbn="978-0-451-52493-5",
+                    pages=200,
+                )
+            ]
+        )
+
+        self.assertEqual(Book.objects.get().isbn_num, 9780451524935)
+
+    def test_isbn_num_from_queryset_update(self):
+        """Test that QuerySet.update(isbn=...) refreshes isbn_num"""
+        author = Author.objects.create(name="Test Author")
+        publisher = Publisher.objects.create(name="Test Publisher")
+        Book.objects.create(
+            title="Book 1",
+            author=author,
+            publisher=publisher,
+            publication_date="2024-01-01",
+            isbn="1234567890123",
+            pages=200,
+        )
+
+        Book.objects.filter(title="Book 1").update(isbn="978-0-451-52634-2")
+
+        self.assertEqual(Book.objects.get().isbn_num, 9780451526342)
+
+    def test_isbn_num_from_partial_updates(self):
+        """Test that save(update_fields=...) and bulk_update refresh isbn_num, freeing the previous ISBN"""
+        author = Author.objects.create(name="Test Author")
+        publisher = Publisher.objects.create(name="Test Publisher")
+        book = Book.objects.create(
+            title="Book 1",
+            author=author,
+            publisher=publisher,
+            publication_date="2024-01-01",
+            isbn="1111111111111",
+            pages=200,
+        )
+
+        book.isbn = "2222222222222"
+        book.save(update_fields=["isbn"])
+        self.assertEqual(Book.objects.get().isbn_num, 2222222222222)
+
+        book.isbn = "3333333333333"
+        Book.objects.bulk_update([book], ["isbn"])
+        self.assertEqual(Book.objects.get().isbn_num, 3333333333333)
+
+        Book.objects.create(
+            title="Book 2",
+            author=author,
+            publisher=publisher,
+            publication_date="2024-01-02",
+            isbn="1111111111111",
+            pages=250,
+        )
+        self.assertEqual(Book.objects.count(), 2)
+
     def test_unique_author_name_constraint(self):
         """Test that author names must be unique"""
         Author.objects.create(name="John Doe")
@@ -129,7 +301,6 @@ class BooksExampleAppTestCase(TestCase):
 
         Book.objects.create(
             title="Book 1",
-            description="Description",
             author=author,
             publisher=publisher,
             publication_date="2024-01-01",
@@ -148,9 +319,7 @@ class PopulateManagementCommandTestCase(TestCase):
 
     def setUp(self):
         """Clean up before each test"""
-        Book.objects.all().delete()
-        Author.objects.all().delete()
-        Publisher.objects.all().delete()
+        _truncate(BookContent, Book, Author, Publisher)
 
         # Reset the global object counter
         from model_populator import engine
@@ -167,6 +336,13 @@ class PopulateManagementCommandTestCase(TestCase):
         self.assertGreater(Publisher.objects.count(), 0)
         self.assertGreater(Book.objects.count(), 0)
 
+    def test_populate_command_fills_book_content(self):
+        """Test that populating the books app gives every generated book its content"""
+        call_command("populate", "books", "--num", "20", stdout=StringIO())
+
+        self.assertEqual(Book.objects.count(), 20)
+        self.assertEqual(Book.objects.filter(content__isnull=True).count(), 0)
+
     def test_populate_command_specific_model(self):
         """Test the populate command for specific model"""
         out = StringIO()
@@ -2,14 +2,17 @@ import random
 from faker import Faker
 from typing import TypeVar
 from collections import defaultdict
+from functools import partial
+from types import SimpleNamespace
 from tqdm import tqdm, trange
 
 from django.apps import apps
 from django.utils.translation import get_language
 from django.contrib.auth.hashers import make_password
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.constants import OnConflict
 
-from model_populator.proxy import SafeUniqueProxy
+from model_populator.proxy import SafeUniqueProxy, FieldUniqueProxy
 from model_populator.field_mappings import (
     update_settings,
     FIELD_NAME_MAPPING,
@@ -17,6 +20,9 @@ from model_populator.field_mappings import (
     EXCLUDED_APPS,
     EXCLUDED_MODELS,
     AUTO_CREATE_RELATED_MODELS,
+    BULK_CREATE_BATCH_SIZE,
+    FAKE_VALUE_POOL_SIZE,
+    UNIQUE_FAKER_PROVIDERS,
 )
 
 
@@ -26,6 +32,14 @@ _OBJECT_CREATED_COUNT: dict = defaultdict(int)
 _fake: Faker = Faker(locale=get_language())
 _fake_unique: SafeUniqueProxy = SafeUniqueProxy(_fake.unique)
 
+# Upper bound on rows per INSERT statement for each database vendor.
+# PostgreSQL slows down parsing multi-row INSERTs beyond ~1000 rows,
+# MySQL/MariaDB keep benefiting from larger statements.
+BULK_CREATE_MAX_BATCH_SIZE: dict = {"postgresql": 1000, "mysql": 10_000}
+
+# INSERT statements compiled per (model, database alias, rows per statement), see _get_insert_plan.
+_INSERT_PLANS: dict = {}
+
 
 def _get_fake_value_based_on_type(fake, mapping):
     return getattr(fake, mapping[0]["faker"])()
@@ -39,120 +53,222 @@ def _get_fake_decimal_value(fake, mapping):
     )
 
 
-def _get_fake_char_value(fake, mapping, field) -> str:
+def _get_char_provider(mapping, field):
+    """
+    Returns the Faker provider filling a CharField, matched by field name first, then by length.
+    None means the field is filled with a sentence.
+    """
+    for provider, patterns in FIELD_NAME_MAPPING.items():
+        if field.name in patterns:
+            return provider
+
+    min_length = getattr(field, "min_length", None)
+    max_length = getattr(field, "max_length", None)
+    for el in mapping:
+        if el.get("max_length") is not None:
+            if min_length is not None:
+                if min_length > el["max_length"]:
+                    continue
+                return el["faker"]
+
+            elif max_length is not None:
+                if el["max_length"] > max_length:
+                    continue
+                return el["faker"]
+    return None
+
+
+def _get_fake_char_generator(fake, mapping, field):
+    """
+    Returns a function generating values for a CharField.
+    """
     if field.choices:
-        return random.choice(field.choices)[0]
-    else:
-        for provider, patterns in FIELD_NAME_MAPPING.items():
-            if field.name in patterns:
-                if provider == "password":
-                    return make_password(getattr(fake, provider)())
-                return getattr(fake, provider)()
-
-        min_length = getattr(field, "min_length", None)
-        max_length = getattr(field, "max_length", None)
-        for el in mapping:
-            if el.get("max_length") is not None:
-                if min_length is not None:
-                    if min_length > el["max_length"]:
-                        continue
-                    return getattr(fake, el["faker"])()
+        return lambda: random.choice(field.choices)[0]
+    provider = _get_char_provider(mapping, field)
+    if provider == "password":
+        return lambda: make_password(getattr(fake, provider)())
+    if provider is not None:
+        return getattr(fake, provider)
+    return partial(fake.sentence, nb_words=5, variable_nb_words=True)
 
-                elif max_length is not None:
-                    if el["max_length"] > max_length:
-                        continue
-                    return getattr(fake, el["faker"])()
-    return fake.sentence(nb_words=5, variable_nb_words=True)
+
+def _is_unique_field(field) -> bool:
+    """
+    Returns whether generated values for a field must not repeat: unique fields,
+    and CharFields mapped by name to one of the UNIQUE_FAKER_PROVIDERS.
+    """
+    if field.unique:
+        return True
+    if field.__class__.__name__ != "CharField" or field.choices:
+        return False
+    return any(field.name in FIELD_NAME_MAPPING.get(provider, []) for provider in UNIQUE_FAKER_PROVIDERS)
+
+
+def _is_unique_together_field(model, field) -> bool:
+    """
+    Returns whether a field is part of a unique_together or UniqueConstraint of its model.
+    """
+    meta = model._meta
+    return any(field.name in names for names in meta.unique_together) or any(
+        field.name in constraint.fields for constraint in meta.total_unique_constraints
+    )
+
+
+def _get_related_pks(model, related_pks: dict) -> list:
+    """
+    Returns the primary keys of a related model, loaded with a single query and cached in related_pks.
+    """
+    if model not in related_pks:
+        related_pks[model] = list(model.objects.values_list("pk", flat=True))
+    return related_pks[model]
 
 
-def _set_m2m_objects(object, fields: tuple, m2m_objects_number: int = 1) -> None:
+def _set_m2m_objects(object, fields: tuple, m2m_objects_number: int = 1, related_pks: dict = None) -> None:
     """
     Sets ManyToManyField objects for a given model instance.
 
     :param object: The model instance to set ManyToManyField objects for.
     :param fields: List of fields to process, assumed to be ManyToManyFields.
     :param m2m_objects_number: Number of related objects to assign, defaults to 1.
+    :param related_pks: Cache of related model primary keys shared across a batch.
     :return: None
     """
 
+    related_pks = {} if related_pks is None else related_pks
     for field in fields:
         object_m2m = getattr(object, field.name)
         field_model = field.related_model
+        pks = _get_related_pks(field_model, related_pks)
         if AUTO_CREATE_RELATED_MODELS:
-            generate_fake_data(field_model, num_objects=m2m_objects_number)
-        object_m2m.set([random.choice(field_model.objects.all()) for _ in range(m2m_objects_number)])
+            pks.append(generate_fake_data(field_model, num_objects=m2m_objects_number, related_pks=related_pks).pk)
+        object_m2m.set([random.choice(pks) for _ in range(m2m_objects_number)])
 
 
-def _get_fake_fk_object(field, num_objects: int = 1):
+def _get_fake_fk_pk(field, num_objects: int = 1, related_pks: dict = None):
     """
-    Returns a random related object for a ForeignKey or OneToOneField.
+    Returns the primary key of a random related object for a ForeignKey.
+
+    :param field: The ForeignKey to pick a related object for.
+    :param num_objects: Number of objects being generated, used for related objects.
+    :param related_pks: Cache of related model primary keys shared across a batch.
+    :return: Primary key of the related object.
     """
     model = field.related_model
+    related_pks = {} if related_pks is None else related_pks
+    pks = _get_related_pks(model, related_pks)
     if AUTO_CREATE_RELATED_MODELS:
-        generate_fake_data(model, num_objects=num_objects)
-    return random.choice(model.objects.all())
+        pks.append(generate_fake_data(model, num_objects=num_objects, related_pks=related_pks).pk)
+    return random.choice(pks)
 
 
-def generate_fake_data(model, fields: list = [], num_objects: int = 1, m2m_related_objects_number: int = 1):
+def _get_field_plan(model, fields: list = []) -> list:
     """
-    Fills a specific model with fake data.
+    Returns how to fill each field of a model, so building a row doesn't repeat per-field introspection.
 
-    :param model: Model class to fill with fake data.
-    :param fields: List of fields to fill, if empty all fields will be filled.
-    :param num_objects: Number of objects to generate.
-    :param m2m_related_objects_number: Number of related objects to generate for ManyToManyField.
-    :return: None
-    :raises: ValueError if the model is not registered in Django.
-    :raises: TypeError if the model is not a Django model.
-    :raises: Exception if an error occurs while generating fake data.
-    :example:
-        from my_app.models import MyModel
-        generate_fake_data(MyModel, fields=['name', 'description'], num_objects=10)
-    :note: This function will not fill models from excluded apps.
-    :note: If the model has a ForeignKey or OneToOneField, it will
-           attempt to assign a random related object from the related model.
-    :note: If the model has a ManyToManyField, it will not fill it
-           as it requires a different approach to handle multiple related objects.
-    :note: If the model has a field that is not in the FIELD_TYPE_MAPPING,
-           it will skip that field.
-    :note: If the model has a field that is not editable or auto-created,
-           it will skip that field.
+    Values already stored in unique fields are loaded here, once per model.
 
+    :param model: Model class to build rows for.
+    :param fields: List of fields to fill, if empty all fields will be filled.
+    :return: List of (field, generate, poolable) tuples. generate is a function returning a fake value,
+             None for related fields. poolable tells whether values can be reused from a value pool.
     """
 
     global _fake
     global _fake_unique
-    object = model()
     _fields: list = fields or [
         f
         for f in model._meta.get_fields()
         if f.editable and not f.auto_created and not isinstance(f, models.ManyToManyField)
     ]
 
-    if model_unique_together := model._meta.unique_together:
-        _fake_unique.exclude(model_unique_together, model.objects.values_list(*model_unique_together[0]))
+    model_unique_together = model._meta.unique_together
+    if model_unique_together and not _fake_unique.has_excluded((model, model_unique_together)):
+        _fake_unique.exclude((model, model_unique_together), model.objects.values_list(*model_unique_together[0]))
 
+    plan: list = []
     for field in _fields:
 
         field_type = field.__class__.__name__
         mapping = FIELD_TYPE_MAPPING.get(field_type, [])
 
-        fake: SafeUniqueProxy | Faker = _fake_unique if field.unique else _fake
-        if field.unique and not fake.has_excluded(field.attname):
-            fake.exclude(field.attname, model.objects.values_list(field.attname, flat=True))
+        # Values already stored are excluded per model, fields of different models may share an attname.
+        unique = _is_unique_field(field)
+        fake: FieldUniqueProxy | Faker = _fake_unique.for_field((model, field.attname)) if unique else _fake
+        if unique and not _fake_unique.has_excluded((model, field.attname)):
+            _fake_unique.exclude((model, field.attname), model.objects.values_list(field.attname, flat=True))
+        # Values reused from the pool would make rows conflict on any uniqueness guarantee.
+        poolable = not unique and not _is_unique_together_field(model, field)
+
+        if field.one_to_one or field.many_to_one:
+            generate = None
+        elif field_type == "CharField":
+            generate = _get_fake_char_generator(fake, mapping, field)
+        elif field_type == "DecimalField":
+            generate = partial(_get_fake_decimal_value, fake, mapping)
+        else:
+            generate = partial(_get_fake_value_based_on_type, fake, mapping)
+        plan.append((field, generate, poolable))
+    return plan
+
+
+def _get_fake_o2o_pk(field, related_pks: dict = None):
+    """
+    Returns the primary key of a related object for a OneToOneField.
+
+    Related objects that don't have a row of the model yet are used first. They are loaded
+    with a single query and cached in related_pks, a new related object is created once they run out.
+
+    :param field: The OneToOneField to pick a related object for.
+    :param related_pks: Cache of related model primary keys shared across a batch.
+    :return: Primary key of the related object.
+    """
+    related_pks = {} if related_pks is None else related_pks
+    if field not in related_pks:
+        if (field.remote_field.related_name or "").endswith("+"):
+            # Without a reverse relation, related objects without a row can't be looked up.
+            related_pks[field] = []
+        else:
+            free = field.related_model.objects.filter(**{f"{field.related_query_name()}__isnull": True})
+            related_pks[field] = list(free.values_list("pk", flat=True))
+    if free_pks := related_pks[field]:
+        return free_pks.pop()
+    return generate_fake_data(field.related_model, related_pks=related_pks).pk
+
+
+def _build_fake_row(
+    model,
+    fields: list = [],
+    num_objects: int = 1,
+    related_pks: dict = None,
+    value_pools: dict = None,
+    field_plan: list = None,
+) -> dict:
+    """
+    Builds a row of fake data for a model, keyed by field attname.
+
+    :param model: Model class to build a row for.
+    :param fields: List of fields to fill, if empty all fields will be filled.
+    :param num_objects: Number of objects being generated, used for related objects.
+    :param related_pks: Cache of related model primary keys shared across a batch.
+    :param value_pools: Lists of generated values per field outside any uniqueness guarantee. Once a list holds
+                        FAKE_VALUE_POOL_SIZE values, new rows pick from it instead of calling Faker.
+    :param field_plan: Plan built by _get_field_plan, built from fields when not given.
+    :return: Dict of field attnames to values, related objects are given by primary key.
+    """
+
+    row: dict = {}
+    field_plan = _get_field_plan(model, fields) if field_plan is None else field_plan
+    for field, generate, poolable in field_plan:
+        pool = value_pools[field.attname] if poolable and value_pools is not None else None
 
         if field.one_to_one:
-            value = generate_fake_data(field.related_model)
+            value = _get_fake_o2o_pk(field, related_pks)
         elif field.many_to_one:
-            value = _get_fake_fk_object(field, num_objects)
+            value = _get_fake_fk_pk(field, num_objects, related_pks)
+        elif pool is not None and len(pool) >= FAKE_VALUE_POOL_SIZE:
+            value = random.choice(pool)
         else:
-            if field_type == "CharField":
-                fake_value = _get_fake_char_value(fake, mapping, field)
-            elif field_type == "DecimalField":
-                fake_value = _get_fake_decimal_value(fake, mapping)
-            else:
-                fake_value = _get_fake_value_based_on_type(fake, mapping)
-
+            fake_value = generate()
             try:
                 value = field.get_prep_value(fake_value)
             except ValueError:
@@ -163,14 +279,325 @@ def generate_fake_data(model, fields: list = [], num_objects: int = 1, m2m_relat
                         value = None
                     else:
                         continue
+            if pool is not None:
+                pool.append(value)
+
+        row[field.attname] = value
+    return row
+
+
+def _get_bulk_batch_size() -> int:
+    """
+    Returns the bulk_create batch size for the current database vendor.
+    """
+    max_batch_size = BULK_CREATE_MAX_BATCH_SIZE.get(connection.vendor, BULK_CREATE_BATCH_SIZE)
+    return max(1, min(BULK_CREATE_BATCH_SIZE, max_batch_size))
+
+
+def _can_copy_insert(model) -> bool:
+    """
+    Returns whether a model can be populated with PostgreSQL's COPY FROM STDIN.
+
+    COPY does not return primary keys, so models with ManyToManyFields are excluded.
+    """
+    if connection.vendor != "postgresql" or model._meta.many_to_many:
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def _has_unique_constraints(model) -> bool:
+    """
+    Returns whether a model has a unique constraint other than its primary key.
+
+    Only these models insert with conflicts ignored: on some backends ignoring conflicts
+    also hides NOT NULL and CHECK violations, which must still raise.
+    """
+    meta = model._meta
+    return bool(
+        any(f.unique and not f.primary_key for f in meta.concrete_fields)
+        or meta.unique_together
+        or meta.total_unique_constraints
+    )
+
+
+def _needs_model_save(model) -> bool:
+    """
+    Returns whether a model has to be populated one object at a time with Model.save().
+
+    Rows of multi-table inheritance children span several tables, and bulk_create only
+    returns the primary keys needed to set ManyToManyFields on some backends.
+    """
+    if model._meta.concrete_model._meta.parents:
+        return True
+    return bool(model._meta.many_to_many) and not connection.features.can_return_rows_from_bulk_insert
+
+
+def _get_natural_key_field(model):
+    """
+    Returns the first unique field other than the primary key, used to find rows back after an insert.
+    """
+    return next((f for f in model._meta.concrete_fields if f.unique and not f.primary_key), None)
+
+
+def _get_insert_fields(model) -> list:
+    """
+    Returns the fields written when inserting rows, like Model._do_insert: the local concrete
+    fields of the concrete model, leaving out the auto primary key and generated columns.
+    """
+    meta = model._meta.concrete_model._meta
+    return [f for f in meta.local_concrete_fields if f is not meta.auto_field and not getattr(f, "generated", False)]
+
+
+def _wrap_fake_rows(model, rows: list) -> list:
+    """
+    Wraps row dicts into plain objects accepted by Field.pre_save, without running Model.__init__.
+
+    Fields missing from a row are set to their default value.
+    """
+    fields = _get_insert_fields(model)
+    return [
+        SimpleNamespace(**{f.attname: row[f.attname] if f.attname in row else f.get_default() for f in fields})
+        for row in rows
+    ]
+
+
+def _get_field_encoder(field):
+    """
+    Returns a function converting a wrapped row into the database value of a field.
+
+    FileField.pre_save expects a FieldFile set by the field descriptor, while wrapped
+    rows hold the generated file name, so file fields store that name as is.
+    """
+    get_db_prep_save = partial(field.get_db_prep_save, connection=connection)
+    if isinstance(field, models.FileField):
+        return lambda object: get_db_prep_save(getattr(object, field.attname))
+    return lambda object: get_db_prep_save(field.pre_save(object, True))
+
+
+def _get_insert_plan(model, num_rows: int = 1) -> tuple:
+    """
+    Returns the INSERT statement, fields and value encoders for a model.
+
+    The plan is built once per model, database and number of rows, so inserting
+    a row only runs the field encoders instead of rebuilding the statement.
+
+    :param model: Model class to insert rows into.
+    :param num_rows: Number of rows inserted by one execution of the statement.
+    :return: Tuple of (sql, fields, encoders).
+    """
+    key = (model, connection.alias, num_rows)
+    if key not in _INSERT_PLANS:
+        fields = _get_insert_fields(model)
+        quote_name = connection.ops.quote_name
+        ignore_conflicts = connection.features.supports_ignore_conflicts and _has_unique_constraints(model)
+        on_conflict = OnConflict.IGNORE if ignore_conflicts else None
+        if on_conflict and connection.vendor == "sqlite" and connection.features.supports_update_conflicts:
+            # INSERT OR IGNORE also skips NOT NULL and CHECK violations, ON CONFLICT DO NOTHING only unique ones.
+            insert_statement, suffix = "INSERT INTO", "ON CONFLICT DO NOTHING"
+        else:
+            insert_statement = connection.ops.insert_statement(on_conflict=on_conflict)
+            suffix = connection.ops.on_conflict_suffix_sql(fields, on_conflict, None, None)
+        sql = "%s %s (%s) %s" % (
+            insert_statement,
+            quote_name(model._meta.db_table),
+            ", ".join(quote_name(f.column) for f in fields),
+            connection.ops.bulk_insert_sql(fields, [["%s"] * len(fields)] * num_rows),
+        )
+        if suffix:
+            sql = f"{sql} {suffix}"
+        encoders = [_get_field_encoder(f) for f in fields]
+        _INSERT_PLANS[key] = (sql, fields, encoders)
+    return _INSERT_PLANS[key]
+
+
+def _encode_rows(encoders: list, objects: list) -> list:
+    """
+    Converts wrapped rows into tuples of database values, in the order of the insert plan's fields.
+    """
+    return [tuple(encode(object) for encode in encoders) for object in objects]
+
+
+def _executemany_is_batched() -> bool:
+    """
+    Returns whether the database driver batches executemany() instead of running one round-trip per row.
+
+    psycopg2 is the only supported driver that doesn't: sqlite3 runs in process, psycopg 3 uses
+    pipeline mode and mysqlclient rewrites the INSERT into a multi-row statement.
+    """
+    if connection.vendor != "postgresql":
+        return True
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def _get_rowcount(cursor, default: int) -> int:
+    """
+    Returns the number of rows written by the cursor's last statement, or default when the driver doesn't report it.
+    """
+    return default if cursor.rowcount is None or cursor.rowcount < 0 else cursor.rowcount
+
+
+def _insert_rows(model, objects: list) -> int:
+    """
+    Inserts a batch of wrapped rows with the model's precompiled INSERT statement.
+
+    The single-row statement is sent with executemany() when the driver batches it,
+    otherwise each batch is sent as one multi-row INSERT.
+    Rows conflicting with a unique constraint are skipped by the database when supported.
+
+    :param model: Model class of the rows.
+    :param objects: Rows wrapped by _wrap_fake_rows.
+    :return: Number of rows inserted.
+    """
+    sql, fields, encoders = _get_insert_plan(model)
+    rows = _encode_rows(encoders, objects)
+    batch_size = _get_bulk_batch_size()
+    executemany = _executemany_is_batched()
+    if not executemany:
+        batch_size = min(batch_size, max(1, connection.ops.bulk_batch_size(fields, rows)))
+    inserted = 0
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            if executemany:
+                cursor.executemany(sql, batch)
+            else:
+                cursor.execute(_get_insert_plan(model, len(batch))[0], [value for row in batch for value in row])
+            inserted += _get_rowcount(cursor, len(batch))
+    return inserted
 
-        setattr(object, field.name, value)
+
+def _copy_insert(model, objects: list) -> int:
+    """
+    Streams a batch of wrapped rows into PostgreSQL with COPY FROM STDIN.
+
+    Models with unique constraints are copied into a temporary table first and
+    moved with INSERT ... ON CONFLICT DO NOTHING, so duplicates are skipped.
+
+    :param model: Model class of the rows.
+    :param objects: Rows wrapped by _wrap_fake_rows.
+    :return: Number of rows inserted.
+    """
+
+    meta = model._meta
+    quote_name = connection.ops.quote_name
+    _, fields, encoders = _get_insert_plan(model)
+    columns = ", ".join(quote_name(f.column) for f in fields)
+    table = quote_name(meta.db_table)
+    rows = _encode_rows(encoders, objects)
+
+    has_unique = _has_unique_constraints(model)
+    target = quote_name(f"{meta.db_table}_copy") if has_unique else table
+    inserted = len(rows)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if has_unique:
+            cursor.execute(f"CREATE TEMPORARY TABLE {target} AS SELECT {columns} FROM {table} WITH NO DATA")
+        with cursor.copy(f"COPY {target} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+        if has_unique:
+            cursor.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {target} ON CONFLICT DO NOTHING")
+            inserted = _get_rowcount(cursor, inserted)
+            cursor.execute(f"DROP TABLE {target}")
+    return inserted
+
+
+def _bulk_save_fake_rows(model, rows: list, m2m_objects_number: int = 1, related_pks: dict = None) -> int:
+    """
+    Inserts a batch of fake rows.
+
+    Models with ManyToManyFields go through bulk_create to get primary keys back,
+    other models skip model instantiation and use COPY on PostgreSQL or plain INSERTs elsewhere.
+    Rows conflicting with a unique constraint are skipped instead of raising.
+
+    :param model: Model class of the rows.
+    :param rows: Row dicts built by _build_fake_row.
+    :param m2m_objects_number: Number of related objects to assign for ManyToManyField.
+    :param related_pks: Cache of related model primary keys shared across a batch.
+    :return: Number of rows inserted, rows skipped on conflict are not counted.
+    """
+
+    if many_to_many_fields := model._meta.many_to_many:
+        # Ignoring conflicts means bulk_create can't set primary keys,
+        # so they are looked up again by natural key.
+        natural_key = _get_natural_key_field(model)
+        ignore_conflicts = natural_key is not None and connection.features.supports_ignore_conflicts
+        objects = [model(**row) for row in rows]
+        if ignore_conflicts:
+            # Keys stored before the insert belong to existing rows, whose relations must be left alone.
+            same_keys = model.objects.filter(
+                **{f"{natural_key.attname}__in": [getattr(object, natural_key.attname) for object in objects]}
+            )
+            existing_keys = set(same_keys.values_list(natural_key.attname, flat=True))
+        batch_size = _get_bulk_batch_size()
+        objects = model.objects.bulk_create(objects, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+        if ignore_conflicts:
+            pks = dict(same_keys.values_list(natural_key.attname, "pk"))
+            created = []
+            for object in objects:
+                key = getattr(object, natural_key.attname)
+                if key in existing_keys or key not in pks:
+                    continue
+                # Only the first object of the batch with a given key was inserted.
+                existing_keys.add(key)
+                object.pk = pks[key]
+                object._state.adding, object._state.db = False, model.objects.db
+                created.append(object)
+            objects = created
+        for object in objects:
+            _set_m2m_objects(object, many_to_many_fields, m2m_objects_number, related_pks)
+        inserted = len(objects)
+    elif _can_copy_insert(model):
+        inserted = _copy_insert(model, _wrap_fake_rows(model, rows))
+    else:
+        inserted = _insert_rows(model, _wrap_fake_rows(model, rows))
+    _OBJECT_CREATED_COUNT[model._meta.model_name] += inserted
+    return inserted
+
+
+def generate_fake_data(
+    model, fields: list = [], num_objects: int = 1, m2m_related_objects_number: int = 1, related_pks: dict = None
+):
+    """
+    Fills a specific model with fake data.
+
+    :param model: Model class to fill with fake data.
+    :param fields: List of fields to fill, if empty all fields will be filled.
+    :param num_objects: Number of objects to generate.
+    :param m2m_related_objects_number: Number of related objects to generate for ManyToManyField.
+    :param related_pks: Cache of related model primary keys, shared by the calls of a batch
+                        so related tables are read once instead of once per object.
+    :return: None
+    :raises: ValueError if the model is not registered in Django.
+    :raises: TypeError if the model is not a Django model.
+    :raises: Exception if an error occurs while generating fake data.
+    :example:
+        from my_app.models import MyModel
+        generate_fake_data(MyModel, fields=['name', 'description'], num_objects=10)
+    :note: This function will not fill models from excluded apps.
+    :note: If the model has a ForeignKey or OneToOneField, it will
+           attempt to assign a random related object from the related model.
+    :note: If the model has a ManyToManyField, it will not fill it
+           as it requires a different approach to handle multiple related objects.
+    :note: If the model has a field that is not in the FIELD_TYPE_MAPPING,
+           it will skip that field.
+    :note: If the model has a field that is not editable or auto-created,
+           it will skip that field.
+
+    """
+
+    related_pks = {} if related_pks is None else related_pks
+    object = model(**_build_fake_row(model, fields, num_objects, related_pks))
     object.save()
     _OBJECT_CREATED_COUNT[model._meta.model_name] += 1
 
     if many_to_many_fields := object.__class__._meta.many_to_many:
         m2m_related_objects_number = min(m2m_related_objects_number, num_objects)
-        _set_m2m_objects(object, many_to_many_fields, m2m_related_objects_number)
+        _set_m2m_objects(object, many_to_many_fields, m2m_related_objects_number, related_pks)
 
     return object
 
@@ -225,6 +652,8 @@ def generate_model_fakes(model, fields: list = [], num_objects: int = 1, m2m_obj
     :param num_objects: Number of objects to generate.
     :param m2m_objects_number: Number of related objects to generate for ManyToManyField.
     :return: True if successful, False otherwise.
+    :note: Objects are inserted with bulk_create, flushed every BULK_CREATE_BATCH_SIZE objects
+           (capped per database vendor by BULK_CREATE_MAX_BATCH_SIZE).
     """
 
     if model._meta.app_label in EXCLUDED_APPS or model in EXCLUDED_MODELS:
@@ -232,8 +661,28 @@ def generate_model_fakes(model, fields: list = [], num_objects: int = 1, m2m_obj
     if _OBJECT_CREATED_COUNT[model._meta.model_name] >= num_objects:
         return
 
+    # Multi-table inheritance children need their parent rows saved first, and models with
+    # ManyToManyFields need primary keys back from the insert, which not every backend returns.
+    # Related primary keys are loaded once per model and reused for every row.
+    related_pks: dict = {}
+    if _needs_model_save(model):
+        for _ in trange(num_objects, desc=get_model_description(model)):
+            generate_fake_data(model, fields, num_objects, m2m_objects_number, related_pks)
+        return
+
+    m2m_objects_number = min(m2m_objects_number, num_objects)
+    batch_size = _get_bulk_batch_size()
+    value_pools = defaultdict(list) if FAKE_VALUE_POOL_SIZE else None
+    # Field introspection and stored unique values are handled once, not for every row.
+    field_plan = _get_field_plan(model, fields)
+    batch: list = []
     for _ in trange(num_objects, desc=get_model_description(model)):
-        generate_fake_data(model, fields, num_objects, m2m_objects_number)
+        batch.append(_build_fake_row(model, fields, num_objects, related_pks, value_pools, field_plan))
+        if len(batch) >= batch_size:
+            _bulk_save_fake_rows(model, batch, m2m_objects_number, related_pks)
+            batch = []
+    if batch:
+        _bulk_save_fake_rows(model, batch, m2m_objects_number, related_pks)
 
 
 def generate_fakes_by_name(
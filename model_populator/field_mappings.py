@@ -1,3 +1,5 @@
+import os
+
 from django.conf import settings
 
 
@@ -8,6 +10,20 @@ EXCLUDED_MODELS: list = ["Session", "Permission", "ContentType", "Site", "LogEnt
 
 AUTO_CREATE_RELATED_MODELS: bool = settings.AUTO_CREATE_RELATED_MODELS if hasattr(settings, "AUTO_CREATE_RELATED_MODELS") else True
 
+BULK_CREATE_BATCH_SIZE: int = (
+    settings.BULK_CREATE_BATCH_SIZE
+    if hasattr(settings, "BULK_CREATE_BATCH_SIZE")
+    else int(os.environ.get("POPULATOR_BULK_CREATE_BATCH_SIZE", "1000"))
+)
+
+FAKE_VALUE_POOL_SIZE: int = settings.FAKE_VALUE_POOL_SIZE if hasattr(settings, "FAKE_VALUE_POOL_SIZE") else 256
+
+# Faker providers returning identifiers. Fields mapped to them by name are generated
+# like unique fields, even without a unique constraint (e.g. an ISBN backing a unique column).
+UNIQUE_FAKER_PROVIDERS: list = (
+    settings.UNIQUE_FAKER_PROVIDERS if hasattr(settings, "UNIQUE_FAKER_PROVIDERS") else ["uuid4", "iban", "isbn13"]
+)
+
 
 FIELD_TYPES: dict = {
     "uuid": [
@@ -165,7 +181,18 @@ FIELD_NAME_MAPPING: dict = {
     "sentence": ["title", "headline", "caption", "subject", "status", "message"],
     "word": ["tag", "label", "category", "type", "code", "kind"],
     "text": ["note", "comment", "details", "instructions", "remarks", "feedback"],
-    "image_url": ["image", "image_url", "profile_pic", "avatar", "thumbnail", "cover_photo", "photo", "img"],
+    "image_url": [
+        "image",
+        "image_url",
+        "profile_pic",
+        "avatar",
+        "thumbnail",
+        "cover_photo",
+        "cover_image",
+        "logo",
+        "photo",
+        "img",
+    ],
     "image": ["image_file", "image_path", "img_file", "uploaded_image", "photo_file"],
     "file_name": ["file", "filename", "document_name", "upload_file", "report_name", "csv_name"],
     "file_path": ["file_path", "document_path", "upload_path", "doc_path", "attachment_path"],
@@ -1,5 +1,6 @@
 from django.apps import apps
 from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
 from model_populator.engine import generate_model_fakes
 
 
@@ -39,7 +40,13 @@ class Command(BaseCommand):
         num = options["num"]
         m2m = options["m2m"]
 
-        for model in get_model_labels(self, options):
-            generate_model_fakes(model, num_objects=num, m2m_objects_number=m2m)
+        # A single transaction lets the database check deferrable constraints
+        # once at commit instead of after every statement.
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+            for model in get_model_labels(self, options):
+                generate_model_fakes(model, num_objects=num, m2m_objects_number=m2m)
 
         self.stdout.write(self.style.SUCCESS("Fake data generated successfully!!!"))
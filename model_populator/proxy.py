@@ -23,6 +23,9 @@ class SafeUniqueProxy:
             raise UniquenessException
         return wrapper
 
+    def for_field(self, field_name) -> "FieldUniqueProxy":
+        return FieldUniqueProxy(self, field_name)
+
     def clear_a_method(self, field_name) -> None:
         self._unique._seen.pop(field_name, None)
 
@@ -30,7 +33,7 @@ class SafeUniqueProxy:
         self._unique.clear()
 
     def has_excluded(self, field_name: str) -> bool:
-        return bool(self._excluded.get(field_name))
+        return field_name in self._excluded
 
     def exclude(self, field_name: str, values: set) -> None:
         self._excluded.setdefault(field_name, set()).update(values)
@@ -40,3 +43,14 @@ class SafeUniqueProxy:
     
     def clear_all_excluded(self) -> None:
         self._excluded.clear()
+
+
+class FieldUniqueProxy:
+    """Generates unique values skipping the ones excluded for a single field."""
+
+    def __init__(self, proxy: SafeUniqueProxy, field_name):
+        self._proxy = proxy
+        self._field_name = field_name
+
+    def __getattr__(self, method_name):
+        return self._proxy.__getattr__(method_name, self._field_name)